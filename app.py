@@ -1,4 +1,5 @@
 import os
+import atexit
 from flask import Flask, request, render_template, send_file, flash, redirect, url_for, session
 from werkzeug.utils import secure_filename
 from pathlib import Path
@@ -21,6 +22,10 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 # In-memory storage for files
 file_storage = {}
 
+# One extractor per app instance so the OCR worker pool is reused across requests
+pdf_extractor = PDFExtractor()
+atexit.register(pdf_extractor.close)
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -66,7 +71,6 @@ def process_files():
             return redirect(url_for('upload_file'))
 
         # Initialize components
-        pdf_extractor = PDFExtractor()
         excel_exporter = ExcelExporter()
         
         # Process each PDF
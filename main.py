@@ -33,20 +33,21 @@ def main():
     
     # Process each PDF
     all_contacts = []
-    for pdf_file in tqdm(pdf_files, desc="Processing PDFs"):
-        try:
-            # Extract data from PDF
-            extracted_data = pdf_extractor.extract(pdf_file)
+    with pdf_extractor:
+        for pdf_file in tqdm(pdf_files, desc="Processing PDFs"):
+            try:
+                # Extract data from PDF
+                extracted_data = pdf_extractor.extract(pdf_file)
             
-            # Skip enrichment
-            for contact in extracted_data:
-                contact['source_pdf'] = pdf_file.name
-                contact['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            all_contacts.extend(extracted_data)
+                # Skip enrichment
+                for contact in extracted_data:
+                    contact['source_pdf'] = pdf_file.name
+                    contact['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                all_contacts.extend(extracted_data)
             
-        except Exception as e:
-            logging.error(f"Error processing {pdf_file.name}: {str(e)}")
-            continue
+            except Exception as e:
+                logging.error(f"Error processing {pdf_file.name}: {str(e)}")
+                continue
     
     if not all_contacts:
         logging.error("No contacts were extracted from the PDFs")
@@ -1,11 +1,58 @@
 import re
+import time
+import shutil
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import PyPDF2
 
+try:
+    import pytesseract
+    from pdf2image import convert_from_path
+    # The Python packages only wrap the tesseract and pdftoppm (Poppler) programs
+    OCR_AVAILABLE = bool(shutil.which("tesseract") and shutil.which("pdftoppm"))
+except ImportError:
+    OCR_AVAILABLE = False
+
+
+def _ocr_page(pdf_path: str, page_number: int, dpi: int, timeout: float) -> str:
+    """Render a single page to an image and run Tesseract OCR on it within `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=page_number, last_page=page_number, timeout=timeout / 2)
+    texts = []
+    for image in images:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"page {page_number} exceeded {timeout}s")
+        texts.append(pytesseract.image_to_string(image, timeout=remaining))
+    return "\n".join(texts)
+
+
+def _timed_ocr_page(ocr_page, pdf_path: str, page_number: int, dpi: int, timeout: float) -> Tuple[str, float]:
+    """Run `ocr_page` in the worker and return its text along with the elapsed time."""
+    start = time.perf_counter()
+    text = ocr_page(pdf_path, page_number, dpi, timeout)
+    return text, time.perf_counter() - start
+
+
 class PDFExtractor:
-    def __init__(self):
+    def __init__(self, ocr_workers: int = 2, min_text_chars: int = 20, ocr_dpi: int = 300, ocr_timeout: float = 60):
+        """
+        Args:
+            ocr_workers: Maximum number of processes used for OCR of scanned pages
+            min_text_chars: Pages with fewer extracted characters are routed to OCR
+            ocr_dpi: Resolution used when rendering pages for OCR
+            ocr_timeout: Seconds to wait for the OCR of a single page
+        """
+        self.ocr_workers = ocr_workers
+        self.min_text_chars = min_text_chars
+        self.ocr_dpi = ocr_dpi
+        self.ocr_timeout = ocr_timeout
+        self._ocr_pool: Optional[ProcessPoolExecutor] = None
+        self._ocr_lock = threading.Lock()
         self.name_pattern = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)')
         self.title_pattern = re.compile(r'(?:CEO|CTO|CFO|Director|Manager|Head|Lead|Senior|Junior|Analyst|Consultant|Advisor|Specialist|Officer|Coordinator|Executive|President|Vice President|VP|MD|Managing Director|Chief|Partner|Principal|Associate|Assistant|Representative|Administrator|Supervisor|Coordinator|Consultant|Advisor|Specialist|Officer|Executive|President|Vice President|VP|MD|Managing Director|Chief|Partner|Principal|Associate|Assistant|Representative|Administrator|Supervisor)', re.IGNORECASE)
         self.email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
@@ -29,14 +76,95 @@ class PDFExtractor:
             logging.error(f"Error extracting data from {pdf_path}: {str(e)}")
             return []
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the OCR worker pool, if one was started."""
+        with self._ocr_lock:
+            pool, self._ocr_pool = self._ocr_pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _discard_ocr_pool(self, pool: ProcessPoolExecutor):
+        """Drop a broken OCR pool so the next OCR request starts a fresh one."""
+        with self._ocr_lock:
+            if self._ocr_pool is pool:
+                self._ocr_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
     def _extract_text(self, pdf_path: Path) -> str:
-        """Extract text from PDF file."""
-        text = ""
+        """Extract text from PDF file, falling back to OCR for image-only pages."""
+        page_texts = []
+        ocr_pages = []
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-        return text
+            for page_number, page in enumerate(reader.pages, start=1):
+                page_text = page.extract_text() or ""
+                if len(page_text.strip()) < self.min_text_chars:
+                    logging.info(f"{pdf_path.name} page {page_number}: {len(page_text.strip())} chars in text layer, routing to OCR")
+                    ocr_pages.append(page_number)
+                else:
+                    logging.info(f"{pdf_path.name} page {page_number}: using text layer")
+                page_texts.append(page_text)
+
+        if ocr_pages:
+            for page_number, ocr_text in self._ocr_pages(pdf_path, ocr_pages).items():
+                # Keep whatever the text layer had unless OCR recovered more
+                if len(ocr_text.strip()) > len(page_texts[page_number - 1].strip()):
+                    page_texts[page_number - 1] = ocr_text
+
+        return "".join(page_text + "\n" for page_text in page_texts)
+
+    def _ocr_pages(self, pdf_path: Path, page_numbers: List[int]) -> Dict[int, str]:
+        """Run OCR on the given pages in the dedicated OCR process pool."""
+        if not OCR_AVAILABLE:
+            logging.warning(f"{pdf_path.name}: OCR skipped for pages {page_numbers}, pytesseract/pdf2image or tesseract/pdftoppm not installed")
+            return {}
+
+        start = time.perf_counter()
+        pool = None
+        try:
+            # The extractor may be shared across request threads
+            with self._ocr_lock:
+                if self._ocr_pool is None:
+                    self._ocr_pool = ProcessPoolExecutor(max_workers=self.ocr_workers)
+                pool = self._ocr_pool
+                futures = {
+                    page_number: pool.submit(_timed_ocr_page, _ocr_page, str(pdf_path), page_number, self.ocr_dpi, self.ocr_timeout)
+                    for page_number in page_numbers
+                }
+        except Exception as e:
+            logging.error(f"{pdf_path.name}: OCR skipped for pages {page_numbers}, could not start OCR workers: {str(e)}")
+            if pool is not None:
+                self._discard_ocr_pool(pool)
+            return {}
+
+        results = {}
+        for page_number, future in futures.items():
+            try:
+                text, elapsed = future.result(timeout=self.ocr_timeout)
+                results[page_number] = text
+                logging.info(f"{pdf_path.name} page {page_number}: OCR extracted {len(text.strip())} chars in {elapsed:.2f}s")
+            except FutureTimeoutError:
+                logging.error(f"{pdf_path.name} page {page_number}: OCR failed: timed out after {self.ocr_timeout}s")
+                # Free the bounded workers instead of queueing the rest of this document behind a hung page;
+                # pages already handed to a worker cannot be cancelled and finish within their own timeout
+                pending = [number for number, other in futures.items() if number > page_number and other.cancel()]
+                if pending:
+                    logging.warning(f"{pdf_path.name}: OCR cancelled for pages {pending}")
+                break
+            except BrokenProcessPool as e:
+                logging.error(f"{pdf_path.name} page {page_number}: OCR failed: {str(e)}")
+                self._discard_ocr_pool(pool)
+            except Exception as e:
+                logging.error(f"{pdf_path.name} page {page_number}: OCR failed: {str(e)}")
+
+        logging.info(f"{pdf_path.name}: OCR of {len(page_numbers)} page(s) took {time.perf_counter() - start:.2f}s")
+        return results
 
     def _parse_text(self, text: str) -> List[Dict[str, Any]]:
         """Parse extracted text to find contact information."""
@@ -0,0 +1,153 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fpdf import FPDF
+
+import pdf_extractor
+from pdf_extractor import PDFExtractor
+
+
+def _fake_ocr_page(pdf_path, page_number, dpi, timeout):
+    return f"Scanned page {page_number}\nEmail: jane.doe@scannedfund.ch"
+
+
+def _empty_ocr_page(pdf_path, page_number, dpi, timeout):
+    return ""
+
+
+def _crashing_ocr_page(pdf_path, page_number, dpi, timeout):
+    os._exit(1)
+
+
+def _slow_ocr_page(pdf_path, page_number, dpi, timeout):
+    time.sleep(0.5)
+    return "Too late"
+
+
+class _UnavailablePool:
+    def __init__(self, *args, **kwargs):
+        raise OSError("[Errno 38] Function not implemented")
+
+
+def _create_pdf(path: Path, pages):
+    pdf = FPDF()
+    for lines in pages:
+        pdf.add_page()
+        pdf.set_font('Arial', '', 12)
+        for line in lines:
+            pdf.cell(0, 10, line, ln=True)
+    pdf.output(str(path))
+    return path
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path):
+    # Page 1 is a blank (image-only) cover, page 2 has a text layer
+    return _create_pdf(tmp_path / 'mixed.pdf', [
+        [],
+        [
+            'Company: Swiss Pension Fund AG',
+            'Contact: John Smith',
+            'Email: john.smith@swisspensionfund.ch',
+        ],
+    ])
+
+
+@pytest.fixture
+def routed_pages(monkeypatch):
+    calls = []
+    original = PDFExtractor._ocr_pages
+
+    def recording_ocr_pages(self, pdf_path, page_numbers):
+        calls.append(list(page_numbers))
+        return original(self, pdf_path, page_numbers)
+
+    monkeypatch.setattr(PDFExtractor, '_ocr_pages', recording_ocr_pages)
+    return calls
+
+
+def test_only_blank_page_is_routed_to_ocr(monkeypatch, mixed_pdf, routed_pages):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_ocr_page', _fake_ocr_page)
+
+    with PDFExtractor(ocr_workers=1) as extractor:
+        extractor._extract_text(mixed_pdf)
+
+    assert routed_pages == [[1]]
+
+
+def test_ocr_text_is_merged_at_page_position(monkeypatch, mixed_pdf):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_ocr_page', _fake_ocr_page)
+
+    with PDFExtractor(ocr_workers=1) as extractor:
+        text = extractor._extract_text(mixed_pdf)
+
+    assert text.index('Scanned page 1') < text.index('Swiss Pension Fund AG')
+    assert 'jane.doe@scannedfund.ch' in text
+    assert 'john.smith@swisspensionfund.ch' in text
+
+
+def test_text_layer_kept_when_ocr_unavailable(monkeypatch, mixed_pdf):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', False)
+
+    with PDFExtractor() as extractor:
+        contacts = extractor.extract(mixed_pdf)
+
+    assert [contact['email'] for contact in contacts] == ['john.smith@swisspensionfund.ch']
+
+
+def test_short_text_layer_kept_when_ocr_returns_less(monkeypatch, tmp_path):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_ocr_page', _empty_ocr_page)
+    pdf_path = _create_pdf(tmp_path / 'short.pdf', [['Jane Doe, CEO']])
+
+    with PDFExtractor(ocr_workers=1) as extractor:
+        text = extractor._extract_text(pdf_path)
+
+    assert 'Jane Doe, CEO' in text
+
+
+def test_worker_crash_falls_back_and_pool_is_rebuilt(monkeypatch, mixed_pdf):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_ocr_page', _crashing_ocr_page)
+
+    with PDFExtractor(ocr_workers=1) as extractor:
+        contacts = extractor.extract(mixed_pdf)
+        assert [contact['email'] for contact in contacts] == ['john.smith@swisspensionfund.ch']
+        assert extractor._ocr_pool is None
+
+        monkeypatch.setattr(pdf_extractor, '_ocr_page', _fake_ocr_page)
+        text = extractor._extract_text(mixed_pdf)
+
+    assert 'Scanned page 1' in text
+
+
+def test_ocr_timeout_is_bounded_and_cancels_queued_pages(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_ocr_page', _slow_ocr_page)
+    pdf_path = _create_pdf(tmp_path / 'scanned.pdf', [[], [], [], [], ['Email: john.smith@swisspensionfund.ch']])
+
+    start = time.perf_counter()
+    with PDFExtractor(ocr_workers=1, ocr_timeout=0.1) as extractor:
+        text = extractor._extract_text(pdf_path)
+        assert time.perf_counter() - start < 0.4
+    # Closing only waits for pages already handed to the worker, the rest were cancelled
+    assert time.perf_counter() - start < 1.5
+
+    assert 'OCR cancelled for pages' in caplog.text
+    assert 'Too late' not in text
+    assert 'john.smith@swisspensionfund.ch' in text
+
+
+def test_pool_creation_failure_keeps_text_layer(monkeypatch, mixed_pdf):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, 'ProcessPoolExecutor', _UnavailablePool)
+
+    with PDFExtractor() as extractor:
+        contacts = extractor.extract(mixed_pdf)
+        assert extractor._ocr_pool is None
+
+    assert [contact['email'] for contact in contacts] == ['john.smith@swisspensionfund.ch']